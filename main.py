@@ -17,12 +17,16 @@ from rich.table import Table
 from rich.panel import Panel
 import os
 from module.title_changer import change_title
+from module.log_listener import start_log_listener
 
 
 async def main() -> None:
     # 윈도우에서 실행한 경우 콘솔 타이틀 변경
     change_title()
 
+    # 페이지/에피소드 요청 태스크를 만들 때, 바로 진행 가능한 부분은 이벤트 루프를 거치지 않고 즉시 실행
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # 세팅 파일 없으면 자동 생성 & 값 읽기
     s = Setting()
     while True:
@@ -66,8 +70,6 @@ async def main() -> None:
                             title_id, nid_aut, nid_ses
                         )
 
-                        print(analyzer.__dict__)
-
                 # 분석된 웹툰 정보를 Rich 패널로 표시 (downloader.py 디자인 참고)
                 console = Console()
 
@@ -76,9 +78,7 @@ async def main() -> None:
                 info_table.add_column("값", style="white")
 
                 info_table.add_row("웹툰명:", analyzer.title_name)
-                info_table.add_row(
-                    "총 에피소드 수:", f"{len(analyzer.full_episodes)}화"
-                )
+                info_table.add_row("총 에피소드 수:", f"{analyzer.total_count}화")
                 info_table.add_row(
                     "다운로드 가능한 에피소드 수:",
                     f"{len(analyzer.downloadable_episodes)}화",
@@ -159,4 +159,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # 로그 출력은 별도 스레드에서 처리 (이벤트 루프가 콘솔 출력에 막히지 않도록)
+    log_listener = start_log_listener()
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
@@ -0,0 +1,42 @@
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# 로그 출력 설정 (실행부에서 한 번만 호출)
+# 이벤트 루프 스레드에서는 QueueHandler가 로그 레코드를 큐에 넣기만 하고,
+# 포맷팅과 콘솔 출력은 QueueListener의 별도 스레드에서 처리한다.
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """
+    레코드를 포맷팅하지 않고 그대로 큐에 넣는 QueueHandler
+    기본 QueueHandler.prepare()는 로그를 남긴 스레드(이벤트 루프)에서 메시지를 포맷팅하므로,
+    같은 프로세스 안의 큐만 사용하는 경우에는 포맷팅을 QueueListener 스레드로 미룬다.
+    (로그 인자로 넘긴 객체를 나중에 수정하면 수정된 값이 출력될 수 있음)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_log_listener(level: int = logging.INFO) -> QueueListener:
+    """
+    루트 로거에 QueueHandler를 연결하고, 콘솔 출력을 담당하는 QueueListener를 시작한 뒤 리턴
+    프로그램 종료 시 리턴받은 listener의 stop()을 호출해야 남은 로그가 모두 출력됨.
+    :param level: 루트 로거 레벨 (기본값: INFO)
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    # 진행 상황 로그도 다른 화면 출력(print, rich)과 같이 표준 출력으로 내보낸다
+    # (StreamHandler 기본값은 stderr라서 출력을 파일로 돌리면 로그만 빠지거나 순서가 섞임)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_DeferredFormatQueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    listener.start()
+    return listener
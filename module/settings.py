@@ -28,9 +28,10 @@ class Setting:
                 config["ZeroFill"]["Image"] = "4"
 
                 config["Download"] = {}  # 다운로드 관련 설정 섹션
-                config["Download"]["BatchSize"] = "5"  # 배치 크기
+                config["Download"]["BatchSize"] = "5"  # 이미지 URL 수집 동시 요청 수
                 config["Download"]["MaxConcurrent"] = "10"  # 최대 동시 다운로드 수
-                config["Download"]["DelaySeconds"] = "1"  # 배치 간 대기 시간(초)
+                # 배치 간 대기 시간(초), 현재는 사용하지 않음 (이전 설정 파일 호환용)
+                config["Download"]["DelaySeconds"] = "1"
 
                 # DEFAULT 섹션은 기본적으로 생성되어 있어 생성없이 쓸 수 있다
                 config["DEFAULT"]["DownloadPath"] = "./Webtoon_Download"
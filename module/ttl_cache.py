@@ -0,0 +1,129 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    일정 시간(ttl) 동안만 값을 보관하는 sqlite 파일 캐시
+    프로그램을 다시 실행해도 같은 웹툰을 다운로드할 때 동일한 페이지 요청/파싱을 반복하지 않기 위해 사용.
+    값은 JSON으로 저장하므로 JSON으로 변환 가능한 값(문자열, 숫자, 리스트 등)만 보관할 수 있다.
+    (캐시 파일을 열거나 쓸 수 없으면 캐시 없이 동작)
+
+    open()으로 연 연결 하나를 close()까지 재사용한다.
+    모든 메서드는 파일 I/O를 하는 동기 함수이므로, 이벤트 루프에서는 asyncio.to_thread로 호출하고
+    여러 키는 get_many/set_many로 한 번에 처리한다.
+    """
+
+    def __init__(self, path: str, table: str, ttl: float) -> None:
+        """
+        :param path: 캐시 파일 경로
+        :param table: 값을 저장할 테이블 이름 (캐시 종류별로 구분)
+        :param ttl: 값을 보관할 시간(초)
+        """
+        self.__path = path
+        self.__table = table
+        self.__ttl = ttl
+        self.__connection: Optional[sqlite3.Connection] = None
+        # to_thread로 호출하면 매번 다른 스레드에서 실행될 수 있으므로 연결 사용을 직렬화
+        self.__lock = threading.Lock()
+
+    def open(self) -> None:
+        """캐시 파일 연결 (테이블이 없으면 생성하고, 만료된 값은 이때 한 번만 정리)"""
+        with self.__lock:
+            if self.__connection is not None:
+                return
+            try:
+                connection = sqlite3.connect(self.__path, check_same_thread=False)
+                # WAL + synchronous=NORMAL: 값을 쓸 때마다 디스크 동기화(fsync)를 기다리지 않음
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                with connection:
+                    connection.execute(
+                        f"CREATE TABLE IF NOT EXISTS {self.__table} "
+                        "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+                    )
+                    connection.execute(
+                        f"DELETE FROM {self.__table} WHERE expires_at < ?",
+                        (time.time(),),
+                    )
+            except sqlite3.Error as e:
+                logger.debug("캐시 파일 열기 실패 (%s): %s", self.__path, e)
+                return
+            self.__connection = connection
+
+    def close(self) -> None:
+        """캐시 파일 연결 닫기"""
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """만료되지 않은 값이 있으면 리턴, 없거나 만료되었으면 None"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        만료되지 않은 값이 있는 키만 {키: 값} 딕셔너리로 리턴
+        (캐시가 열려있지 않거나 읽기에 실패하면 빈 딕셔너리)
+        """
+        encoded = {json.dumps(key): key for key in keys}
+        if not encoded:
+            return {}
+
+        with self.__lock:
+            if self.__connection is None:
+                return {}
+            try:
+                # 키 개수만큼 자리표시자를 만들어 한 번의 쿼리로 조회
+                placeholders = ", ".join("?" * len(encoded))
+                rows = self.__connection.execute(
+                    f"SELECT key, value FROM {self.__table} "
+                    f"WHERE key IN ({placeholders}) AND expires_at >= ?",
+                    (*encoded, time.time()),
+                ).fetchall()
+                return {encoded[key]: json.loads(value) for key, value in rows}
+            except (sqlite3.Error, ValueError) as e:
+                logger.debug("캐시 읽기 실패 (%s): %s", self.__path, e)
+                return {}
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 저장 (같은 키가 있으면 덮어쓰고 만료 시각 갱신)"""
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """(키, 값) 여러 개를 하나의 트랜잭션으로 저장"""
+        expires_at = time.time() + self.__ttl
+        rows = [
+            (json.dumps(key), expires_at, json.dumps(value)) for key, value in items
+        ]
+        if not rows:
+            return
+
+        with self.__lock:
+            if self.__connection is None:
+                return
+            try:
+                with self.__connection:
+                    self.__connection.executemany(
+                        f"INSERT OR REPLACE INTO {self.__table} VALUES (?, ?, ?)", rows
+                    )
+            except sqlite3.Error as e:
+                logger.debug("캐시 저장 실패 (%s): %s", self.__path, e)
+
+    def clear(self) -> None:
+        """저장된 값 모두 제거"""
+        with self.__lock:
+            if self.__connection is None:
+                return
+            try:
+                with self.__connection:
+                    self.__connection.execute(f"DELETE FROM {self.__table}")
+            except sqlite3.Error as e:
+                logger.debug("캐시 삭제 실패 (%s): %s", self.__path, e)
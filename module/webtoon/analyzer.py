@@ -1,32 +1,156 @@
 import asyncio
+import logging
 import aiohttp
-import sys
-import os
-from typing import List, Tuple, Optional
+import numpy as np
+from pydantic import ValidationError
+from yarl import URL
+from typing import Iterable, List, NamedTuple, Optional
 from dataclasses import dataclass
 
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
-
 # 기존 pydantic 타입 정의 import
 from module.headers import headers
-from type.api.article_list import NWebtoonArticleListData
-from type.api.comic_info import NWebtoonMainData, WebtoonCode
+from type.api.article_list import ArticleItemLite, NWebtoonArticleListLite
+from type.api.comic_info import NWebtoonMainDataLite, WebtoonCode
 from type.api.webtoon_type import WebtoonType, to_webtoon_type
 
+# 디버그용 로그 (기본적으로 출력되지 않으며, 필요할 때만 로그 레벨을 DEBUG로 설정)
+logger = logging.getLogger(__name__)
+
 
-@dataclass
-class EpisodeInfo:
-    """에피소드 정보를 담는 데이터 클래스"""
+# 에피소드 수만큼 대량으로 생성되므로 가벼운 NamedTuple로 정의 (속성 접근은 dataclass와 동일)
+class EpisodeInfo(NamedTuple):
+    """에피소드 정보를 담는 튜플 클래스"""
 
     no: int
     subtitle: str
     thumbnail_lock: bool
 
 
-@dataclass
+@dataclass(slots=True)
+class EpisodeColumns:
+    """
+    에피소드 정보를 필드(열) 단위 배열로 담는 데이터 클래스
+    EpisodeInfo 리스트와 같은 내용이지만, 한 필드만 훑는 작업(잠금 경계 찾기, 화수 목록 등)을
+    파이썬 반복문 대신 numpy 벡터 연산으로 처리할 수 있다.
+    """
+
+    no: np.ndarray  # int32
+    subtitle: List[str]
+    thumbnail_lock: np.ndarray  # bool
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[ArticleItemLite]) -> "EpisodeColumns":
+        """
+        list API 응답의 에피소드 항목(articleList)에서 바로 열 단위 배열 생성
+        (EpisodeInfo를 거치지 않고, 항목을 한 번 훑으면서 세 필드를 각각의 리스트에 모은다)
+        """
+        nos: List[int] = []
+        subtitles: List[str] = []
+        locks: List[bool] = []
+        for article in articles:
+            nos.append(article.get("no", 0))
+            subtitles.append(article.get("subtitle", ""))
+            locks.append(article.get("thumbnailLock", False))
+
+        return cls(
+            no=np.array(nos, dtype=np.int32),
+            subtitle=subtitles,
+            thumbnail_lock=np.array(locks, dtype=np.bool_),
+        )
+
+    @classmethod
+    def empty(cls, count: int) -> "EpisodeColumns":
+        """count개 크기로 미리 할당한 열 단위 배열 (fill로 채움)"""
+        return cls(
+            no=np.zeros(count, dtype=np.int32),
+            subtitle=[""] * count,
+            thumbnail_lock=np.zeros(count, dtype=np.bool_),
+        )
+
+    def fill(self, start: int, articles: List[ArticleItemLite]) -> None:
+        """list API 응답의 에피소드 항목(articleList)을 start 위치부터 채움"""
+        end = start + len(articles)
+        self.no[start:end] = [article.get("no", 0) for article in articles]
+        self.subtitle[start:end] = [article.get("subtitle", "") for article in articles]
+        self.thumbnail_lock[start:end] = [
+            article.get("thumbnailLock", False) for article in articles
+        ]
+
+    def __len__(self) -> int:
+        return len(self.subtitle)
+
+    def __getitem__(self, index: slice) -> "EpisodeColumns":
+        """범위(slice)에 해당하는 에피소드만 담은 EpisodeColumns 리턴 (numpy 배열은 복사 없이 view)"""
+        return EpisodeColumns(
+            no=self.no[index],
+            subtitle=self.subtitle[index],
+            thumbnail_lock=self.thumbnail_lock[index],
+        )
+
+    def compact(self, page_size: int, page_counts: List[int]) -> "EpisodeColumns":
+        """
+        페이지마다 page_size 칸씩 할당해서 채운 배열에서, 실제로 채운 부분만 모은 EpisodeColumns 리턴
+        마지막 페이지를 제외한 모든 페이지가 꽉 찼으면 (보통의 경우) 뒷부분을 잘라내기만 한다.
+
+        Args:
+            page_size: 페이지당 할당한 칸 수
+            page_counts: 페이지별로 채운 에피소드 수 (인덱스 = 페이지 번호 - 1)
+        """
+        if all(count == page_size for count in page_counts[:-1]):
+            filled = (len(page_counts) - 1) * page_size + page_counts[-1]
+            return self[:filled]
+
+        # 덜 찬 페이지가 있으면 (수집 중 에피소드 삭제 등) 페이지마다 채운 구간만 이어 붙인다
+        index = np.concatenate(
+            [
+                np.arange(page * page_size, page * page_size + count)
+                for page, count in enumerate(page_counts)
+            ]
+        )
+        return EpisodeColumns(
+            no=self.no[index],
+            subtitle=[self.subtitle[i] for i in index.tolist()],
+            thumbnail_lock=self.thumbnail_lock[index],
+        )
+
+    def sorted_by_no(self) -> "EpisodeColumns":
+        """
+        no 오름차순으로 정렬된 EpisodeColumns 리턴
+        이미 정렬되어 있으면 (sort=ASC 요청이 지켜진 보통의 경우) 비교 한 번으로 그대로 리턴한다.
+        """
+        no = self.no
+        if np.all(no[1:] > no[:-1]):
+            return self
+
+        index = np.argsort(no, kind="stable")
+        return EpisodeColumns(
+            no=no[index],
+            subtitle=[self.subtitle[i] for i in index.tolist()],
+            thumbnail_lock=self.thumbnail_lock[index],
+        )
+
+    def first_lock_index(self) -> int:
+        """thumbnail_lock이 True인 첫 번째 에피소드의 위치 (없으면 전체 길이)"""
+        locks = self.thumbnail_lock
+        if locks.size == 0:
+            return 0
+
+        # argmax는 첫 번째 True 위치에서 멈춘다. True가 하나도 없으면 0이 나오므로
+        # any()로 배열을 한 번 더 훑는 대신 그 위치의 값만 확인한다.
+        index = int(locks.argmax())
+        return index if locks[index] else len(locks)
+
+    def to_episodes(self) -> List[EpisodeInfo]:
+        """기존 코드 호환용 EpisodeInfo 리스트로 변환"""
+        return [
+            EpisodeInfo(no, subtitle, lock)
+            for no, subtitle, lock in zip(
+                self.no.tolist(), self.subtitle, self.thumbnail_lock.tolist()
+            )
+        ]
+
+
+@dataclass(slots=True, frozen=True)
 class WebtoonMetadata:
     """웹툰 메타데이터를 담는 데이터 클래스"""
 
@@ -41,6 +165,18 @@ class WebtoonMetadata:
     total_pages: int = 0
 
 
+def _first_exception(group: ExceptionGroup) -> Exception:
+    """
+    TaskGroup이 발생시킨 ExceptionGroup에서 첫 번째 원래 예외를 꺼내는 함수
+    (ExceptionGroup 그대로 올려보내면 호출부에서는 "unhandled errors in a TaskGroup"만 보이므로,
+    asyncio.gather처럼 실제 실패 원인이 된 예외를 그대로 다시 발생시키기 위해 사용)
+    """
+    exception = group.exceptions[0]
+    while isinstance(exception, ExceptionGroup):
+        exception = exception.exceptions[0]
+    return exception
+
+
 class WebtoonAnalyzer:
     """title id를 받아서 웹툰의 정보를 가져오는 클래스"""
 
@@ -49,13 +185,28 @@ class WebtoonAnalyzer:
         title_id: int,
         nid_aut: Optional[str] = None,
         nid_ses: Optional[str] = None,
+        full_scan: bool = True,
     ) -> None:
         self.__title_id = title_id
 
+        # True : 잠금 에피소드까지 모든 페이지를 가져온다 (full_episodes 완전)
+        # False : 잠금 에피소드가 나오는 페이지까지만 가져온다 (full_episodes는 그 페이지까지만 담김)
+        #   잠금 에피소드는 보통 마지막 페이지에 있어서, 경계 탐색 요청이 순서대로 이어지는 만큼
+        #   전체 페이지를 한꺼번에 요청하는 True보다 느릴 수 있다. (연재 중인 웹툰은 True 권장)
+        self.__full_scan = full_scan
+
         # API 요청에 사용할 URL
         self.__info_url = "https://comic.naver.com/api/article/list/info"
         self.__list_url = "https://comic.naver.com/api/article/list"
 
+        # title_id가 들어간 URL을 yarl.URL로 미리 만들어 둔다
+        # (aiohttp는 str을 받으면 요청마다 URL을 다시 파싱하지만, URL 객체는 그대로 사용한다)
+        # sort=ASC : 1화부터 오름차순으로 받아야 잠금 에피소드(최신화)가 뒤쪽 페이지에 몰린다
+        self.__info_request_url = URL(self.__info_url).with_query(titleId=title_id)
+        self.__list_request_url = URL(self.__list_url).with_query(
+            titleId=title_id, sort="ASC"
+        )
+
         # 성인 웹툰 접근용 쿠키 설정
         self.__cookies = {}
         if nid_aut and nid_ses:
@@ -70,8 +221,23 @@ class WebtoonAnalyzer:
         self.__is_adult = False
         self.__webtoon_type = WebtoonType.webtoon
         self.__synopsis = ""  # 웹툰 설명
-        self.__downloadable_episodes: List[EpisodeInfo] = []
-        self.__full_episodes: List[EpisodeInfo] = []
+        # 에피소드 정보는 열 단위 배열로만 보관하고,
+        # EpisodeInfo 리스트는 full_episodes / downloadable_episodes 를 처음 읽을 때 만든다.
+        self.__episode_columns = EpisodeColumns.empty(0)
+        self.__full_episodes: Optional[List[EpisodeInfo]] = None
+        self.__downloadable_episodes: Optional[List[EpisodeInfo]] = None
+
+        # 모든 API 요청에 재사용할 세션 (async with 진입 시 생성)
+        self.__session: Optional[aiohttp.ClientSession] = None
+
+        # list API 동시 요청 수 제한 (한꺼번에 요청하면 커넥션 풀이 밀리고 429 응답을 받기 쉬움)
+        self.__page_semaphore = asyncio.Semaphore(8)
+
+        # 한 번 가져온 메타데이터 캐시 (같은 데이터를 다시 요청하지 않기 위함)
+        self.__metadata: Optional[WebtoonMetadata] = None
+
+        # 메타데이터를 구할 때 받아온 list API 첫 페이지 (에피소드 수집시 재사용)
+        self.__first_page: Optional[NWebtoonArticleListLite] = None
 
     """
     self의 경우 생성된 객체(instance) 를 가르키므로,
@@ -84,34 +250,94 @@ class WebtoonAnalyzer:
 
     @classmethod
     async def create(
-        cls, title_id: int, nid_aut: Optional[str] = None, nid_ses: Optional[str] = None
+        cls,
+        title_id: int,
+        nid_aut: Optional[str] = None,
+        nid_ses: Optional[str] = None,
+        full_scan: bool = True,
     ) -> "WebtoonAnalyzer":
         """비동기 팩토리 메서드로 WebtoonAnalyzer 인스턴스를 생성하고 초기화"""
-        instance = cls(title_id, nid_aut, nid_ses)  # 여기서 일반생성자 __init__ 실행
-        await instance.__initialize()  # 비동기 함수 실행
+        # 여기서 일반생성자 __init__ 실행
+        instance = cls(title_id, nid_aut, nid_ses, full_scan)
+
+        # 초기화 동안 하나의 세션(커넥션 풀)을 공유하고, 끝나면 세션을 닫는다.
+        async with instance:
+            await instance.__initialize()  # 비동기 함수 실행
         return instance
 
+    async def __aenter__(self) -> "WebtoonAnalyzer":
+        """
+        API 요청에 사용할 세션을 생성한다.
+        요청마다 세션을 새로 만들면 매번 TCP/TLS 연결과 DNS 조회를 다시 하게 되므로,
+        comic.naver.com 으로의 연결을 keep-alive 로 재사용하기 위해 세션을 하나만 유지한다.
+        """
+        if self.__session is None:
+            # DNS 조회 결과는 10분간 캐시 (aiodns가 설치되어 있으면 aiohttp가 자동으로 비동기 resolver 사용)
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                keepalive_timeout=30,
+            )
+            self.__session = aiohttp.ClientSession(
+                headers=headers, cookies=self.__cookies, connector=connector
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """세션을 닫는 함수"""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    @property
+    def __client(self) -> aiohttp.ClientSession:
+        """열려있는 세션을 반환 (async with 블록 밖에서 요청하면 예외 발생)"""
+        if self.__session is None:
+            raise RuntimeError(
+                "세션이 없습니다. async with WebtoonAnalyzer(...) 블록 안에서 요청해주세요."
+            )
+        return self.__session
+
     async def __initialize(self) -> None:
         """웹툰 메타데이터를 가져와 멤버 변수 초기화하는 내부 비동기 함수(메서드)"""
 
         # 웹툰 메타데이터 가져오기
         metadata: WebtoonMetadata = await self.__fetch_webtoon_metadata()
+        logger.debug("웹툰 메타데이터: %s", metadata)
 
         # 에피소드 정보 가져오기 기준을 '성인 여부'가 아니라 'list API가 반환한 페이지 수'로 판단
         # (성인 웹툰이라도 쿠키가 있으면 list API 접근 가능하므로 total_pages>0이면 수집 시도)
         if metadata.total_pages and metadata.total_pages > 0:
-            # 모든 에피소드 정보 가져오기
-            all_episodes = await self.__get_all_episodes(metadata)
-
-            # 다운로드 가능한 에피소드 찾기
-            downloadable_count, downloadable_episodes = (
-                self.__find_downloadable_episodes(all_episodes)
+            # 에피소드 정보는 응답에서 바로 열 단위 배열로 모은다 (필드 단위 검색을 벡터 연산으로 처리하기 위함)
+            if self.__full_scan:
+                # 모든 에피소드 정보 가져오기
+                episode_columns = await self.__get_all_episodes(metadata)
+            else:
+                # 잠금 에피소드가 나오는 페이지까지만 가져오기
+                episode_columns = await self.__get_episodes_until_lock(metadata)
+
+            logger.debug(
+                "에피소드 %d개 수집 완료 (전체 %d화, %d페이지)",
+                len(episode_columns),
+                metadata.total_count,
+                metadata.total_pages,
             )
+
+            # 잠금 경계 찾기와 화수 슬라이싱은 no 오름차순을 전제로 하므로,
+            # 응답이 요청한 순서(sort=ASC)를 따르지 않았으면 여기서 정렬한다
+            episode_columns = episode_columns.sorted_by_no()
+
+            # 다운로드 가능한 에피소드 수 찾기
+            downloadable_count = self.__find_downloadable_count(episode_columns)
         else:
             # list API 접근이 불가(성인+미인증 등)한 경우 빈 값으로 설정
-            all_episodes = []
+            episode_columns = EpisodeColumns.empty(0)
             downloadable_count = 0
-            downloadable_episodes = []
 
         # 데이터를 인스턴스 변수에 저장
         self.__title_name = metadata.title_name
@@ -122,8 +348,9 @@ class WebtoonAnalyzer:
         self.__total_pages = metadata.total_pages
         self.__is_adult = metadata.is_adult
         self.__webtoon_type = metadata.webtoon_type
-        self.__downloadable_episodes = downloadable_episodes
-        self.__full_episodes = all_episodes
+        self.__episode_columns = episode_columns
+        self.__full_episodes = None
+        self.__downloadable_episodes = None
         self.__title_id = metadata.title_id
 
     async def __fetch_webtoon_metadata(self) -> WebtoonMetadata:
@@ -134,72 +361,94 @@ class WebtoonAnalyzer:
             웹툰 메타데이터 (전체 화수, 페이지 크기, 전체 페이지 수)
         """
 
-        # 웹툰의 정보를 가져오기 위해 info api에 요청한다
-        info_url = f"{self.__info_url}?titleId={self.__title_id}"
-
-        # list api 첫 번째 페이지 요청을 활용해 전체 화수, 페이지 크기, 전체 페이지 수를 얻는다.
-        list_url = f"{self.__list_url}?titleId={self.__title_id}&page=1"
-
-        async with aiohttp.ClientSession(
-            headers=headers, cookies=self.__cookies
-        ) as session:
-            # info API 요청
-            async with session.get(info_url) as info_response:
-                if info_response.status != 200:
-                    raise Exception(f"Info API 요청 실패: {info_response.status}")
-
-                info_data = await info_response.json()
-                comic_info = NWebtoonMainData.from_dict(info_data)
-
-                # 웹툰 설명 가져오기
-                synopsis: str = comic_info.synopsis
-
-                # 일반 웹툰 / 베스트도전 / 도전만화 구분 (API 코드 -> 내부 문자열 enum 매핑)
-                webtoon_code: WebtoonCode = comic_info.webtoonLevelCode
-                webtoon_type: WebtoonType = to_webtoon_type(webtoon_code)
-
-                # 성인 웹툰 여부 확인 (age.type이 RATE_18이면 성인 웹툰)
-                is_adult: bool = comic_info.age.type == "RATE_18"
-
-                # 제목 가져오기
-                title_name: str = comic_info.titleName
-
-            # list API 요청
-            # 일반 웹툰이거나, 성인 웹툰이더라도 인증 쿠키가 있으면 시도
-            if (not is_adult) or (is_adult and self.__cookies):
-                async with session.get(list_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # pydantic 모델을 사용하여 데이터 검증
-                        article_list_data = NWebtoonArticleListData.from_dict(data)
-
-                        # API 응답에서 실제 값들을 가져옴
-                        total_count = article_list_data.totalCount
-                        page_size = article_list_data.pageInfo.pageSize
-                        total_pages = article_list_data.pageInfo.totalPages
-                    else:
-                        # 인증이 있어도 실패할 수 있으므로 0으로 설정 (다운로드 비활성)
-                        total_count = 0
-                        page_size = 0
-                        total_pages = 0
-            else:
-                # 성인 웹툰 + 미인증 등으로 list API 접근 불가
-                total_count = 0
-                page_size = 0
-                total_pages = 0
-
-            return WebtoonMetadata(
-                title_id=self.__title_id,
-                title_name=title_name,
-                synopsis=synopsis,
-                is_adult=is_adult,
-                webtoon_type=webtoon_type,
-                total_count=total_count,
-                page_size=page_size,
-                total_pages=total_pages,
-            )
+        # 이미 가져온 메타데이터가 있으면 API를 다시 요청하지 않는다
+        if self.__metadata is not None:
+            return self.__metadata
+
+        # info API(웹툰 정보)와 list API 첫 페이지(전체 화수, 페이지 크기, 전체 페이지 수)를 동시에 요청한다.
+        # 성인 여부는 info 응답을 받아야 알 수 있으므로 첫 페이지는 일단 요청하고, 아래에서 사용 여부를 결정
+        try:
+            async with asyncio.TaskGroup() as tg:
+                info_task = tg.create_task(self.__get_comic_info())
+                first_page_task = tg.create_task(self.__get_first_page())
+        except ExceptionGroup as group:
+            # 한쪽이 실패하면 다른 요청은 취소되고, 실패한 요청의 예외(예: Info API 요청 실패)를 그대로 발생
+            raise _first_exception(group) from None
+        comic_info = info_task.result()
+        first_page = first_page_task.result()
+
+        # 웹툰 설명 가져오기
+        synopsis: str = comic_info.synopsis
+
+        # 일반 웹툰 / 베스트도전 / 도전만화 구분 (API 코드 -> 내부 문자열 enum 매핑)
+        webtoon_code: WebtoonCode = comic_info.webtoonLevelCode
+        webtoon_type: WebtoonType = to_webtoon_type(webtoon_code)
+
+        # 성인 웹툰 여부 확인 (age.type이 RATE_18이면 성인 웹툰)
+        is_adult: bool = comic_info.age.type == "RATE_18"
+
+        # 제목 가져오기
+        title_name: str = comic_info.titleName
+
+        # list API 결과 사용
+        # 일반 웹툰이거나, 성인 웹툰이더라도 인증 쿠키가 있으면 사용
+        # (인증이 있어도 실패할 수 있으므로 그때는 0으로 설정 -> 다운로드 비활성)
+        if first_page is not None and ((not is_adult) or self.__cookies):
+            # 첫 페이지는 에피소드 수집 때 다시 요청하지 않도록 보관
+            self.__first_page = first_page
+
+            # API 응답에서 실제 값들을 가져옴
+            total_count = first_page.totalCount
+            page_size = first_page.pageInfo.pageSize
+            total_pages = first_page.pageInfo.totalPages
+        else:
+            # 성인 웹툰 + 미인증 등으로 list API 접근 불가
+            total_count = 0
+            page_size = 0
+            total_pages = 0
+
+        self.__metadata = WebtoonMetadata(
+            title_id=self.__title_id,
+            title_name=title_name,
+            synopsis=synopsis,
+            is_adult=is_adult,
+            webtoon_type=webtoon_type,
+            total_count=total_count,
+            page_size=page_size,
+            total_pages=total_pages,
+        )
+        return self.__metadata
+
+    async def __get_comic_info(self) -> NWebtoonMainDataLite:
+        """info API로 웹툰 정보(제목, 설명, 웹툰 타입, 연령 등급)를 가져오는 함수"""
+        async with self.__client.get(self.__info_request_url) as info_response:
+            if info_response.status != 200:
+                raise Exception(f"Info API 요청 실패: {info_response.status}")
 
-    async def __get_episode_list_page(self, page: int) -> NWebtoonArticleListData:
+            # 필요한 필드만 있는 경량 pydantic 모델로 응답 본문을 바로 파싱 & 검증
+            return NWebtoonMainDataLite.from_json(await info_response.read())
+
+    async def __get_first_page(self) -> Optional[NWebtoonArticleListLite]:
+        """
+        list API 첫 번째 페이지를 가져오는 함수
+        (성인 웹툰 + 미인증 등으로 요청이 실패하면 예외 대신 None 리턴)
+
+        info 요청과 동시에 보내므로, 사용하지 않을 수도 있는 이 요청이 실패해서
+        (로그인 페이지로 리다이렉트되어 JSON이 아닌 응답 등) 분석 전체가 실패하지 않도록 한다.
+        """
+        list_url = self.__list_request_url % {"page": 1}
+        try:
+            async with self.__client.get(list_url) as response:
+                if response.status != 200:
+                    return None
+
+                # 필요한 필드만 있는 경량 pydantic 모델로 응답 본문을 바로 검증
+                return NWebtoonArticleListLite.from_json(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValidationError) as e:
+            logger.debug("list API 첫 페이지 요청 실패: %s", e)
+            return None
+
+    async def __get_episode_list_page(self, page: int) -> NWebtoonArticleListLite:
         """
         특정 페이지의 에피소드 리스트를 가져오는 함수
 
@@ -209,78 +458,178 @@ class WebtoonAnalyzer:
         Returns:
             해당 페이지의 pydantic 모델 데이터
         """
-        url = f"{self.__list_url}?titleId={self.__title_id}&page={page}"
+        url = self.__list_request_url % {"page": page}
 
-        async with aiohttp.ClientSession(
-            headers=headers, cookies=self.__cookies
-        ) as session:
-            async with session.get(url) as response:
+        async with self.__page_semaphore:
+            async with self.__client.get(url) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    # pydantic 모델을 사용하여 데이터 검증 및 변환
-                    return NWebtoonArticleListData.from_dict(data)
+                    raw = await response.read()
                 else:
                     raise Exception(f"페이지 {page} 요청 실패: {response.status}")
 
-    async def __get_all_episodes(self, metadata: WebtoonMetadata) -> List[EpisodeInfo]:
+        # 필요한 필드만 있는 경량 pydantic 모델로 응답 본문을 바로 검증 및 변환
+        # (검증 중에는 GIL을 놓지 않아 스레드로 넘겨도 겹쳐서 처리되지 않고 전환 비용만 늘어나므로 바로 처리)
+        return NWebtoonArticleListLite.from_json(raw)
+
+    async def __get_all_episodes(self, metadata: WebtoonMetadata) -> EpisodeColumns:
         """
         모든 에피소드 정보를 가져오는 함수
 
         Returns:
-            모든 에피소드 정보 리스트
+            모든 에피소드 정보 (열 단위 배열)
         """
-        # total_pages가 None이면 에피소드 정보를 가져올 수 없으므로 빈 리스트 반환
+        # total_pages가 None이면 에피소드 정보를 가져올 수 없으므로 빈 배열 반환
         if metadata.total_pages is None:
-            return []
-
-        # 모든 페이지를 병렬로 요청 (no=1 ~ no=끝)
-        tasks = []
-        for page in range(1, metadata.total_pages + 1):
-            task = self.__get_episode_list_page(page)
-            tasks.append(task)
-
-        # 모든 요청을 동시에 실행
-        responses: List[NWebtoonArticleListData] = await asyncio.gather(*tasks)
-
-        # 모든 에피소드 정보를 수집
-        all_episodes: list[EpisodeInfo] = []
-
-        for response in responses:
-            # pydantic 모델의 articleList에서 에피소드 정보 추출
-            for episode in response.articleList:
-                episode_info = EpisodeInfo(
-                    no=episode.no,
-                    subtitle=episode.subtitle,
-                    thumbnail_lock=episode.thumbnailLock,
-                )
-                all_episodes.append(episode_info)
-
-        # no 순으로 오름차순 정렬
-        all_episodes.sort(key=lambda x: x.no)
-
-        return all_episodes
-
-    def __find_downloadable_episodes(
-        self, episodes: List[EpisodeInfo]
-    ) -> Tuple[int, List[EpisodeInfo]]:
+            return EpisodeColumns.empty(0)
+
+        # 첫 페이지는 메타데이터를 구할 때 이미 받아왔으므로 그대로 사용한다
+        first_page = self.__first_page
+        if first_page is None:
+            first_page = await self.__get_episode_list_page(1)
+
+        total_pages = metadata.total_pages
+        # 페이지 크기를 모르면 첫 페이지의 에피소드 수를 사용 (마지막 페이지가 아니면 항상 꽉 차 있음)
+        page_size = metadata.page_size or len(first_page.articleList)
+
+        # 모든 페이지가 꽉 찼을 때의 크기로 한 번에 할당하고, 각 페이지를 (page - 1) * page_size + i 위치에 바로 채운다.
+        # (sort=ASC 이므로 보통은 정렬 불필요, 응답은 채운 뒤 보관하지 않음)
+        episodes = EpisodeColumns.empty(total_pages * page_size)
+        page_counts = [0] * total_pages  # 페이지별로 채운 에피소드 수
+        page_counts[0] = self.__fill_page(episodes, 1, page_size, first_page)
+
+        # 나머지 페이지를 병렬로 요청 (page=2 ~ page=끝)
+        # TaskGroup 안에서 실행하므로 한 페이지라도 실패하면 나머지 요청은 바로 취소되고,
+        # 실패한 페이지의 예외(예: 페이지 N 요청 실패: 429)를 그대로 발생시킨다.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                task_pages = {
+                    tg.create_task(self.__get_episode_list_page(page)): page
+                    for page in range(2, total_pages + 1)
+                }
+
+                # 모든 페이지를 기다리지 않고, 먼저 도착한 페이지부터 바로 에피소드를 추출해 자기 위치에 넣는다.
+                async for task in asyncio.as_completed(task_pages):
+                    page = task_pages[task]
+                    page_counts[page - 1] = self.__fill_page(
+                        episodes, page, page_size, task.result()
+                    )
+        except ExceptionGroup as group:
+            raise _first_exception(group) from None
+
+        # 실제로 채운 부분만 리턴 (마지막 페이지 외에 덜 찬 페이지가 없으면 뒷부분만 잘라냄)
+        return episodes.compact(page_size, page_counts)
+
+    async def __get_episodes_until_lock(
+        self, metadata: WebtoonMetadata
+    ) -> EpisodeColumns:
         """
-        다운로드 가능한 에피소드 수를 찾는 함수
+        잠금 에피소드가 처음 나오는 페이지까지만 요청해서 에피소드를 가져오는 함수
+        오름차순(sort=ASC) 기준으로 잠금 에피소드는 항상 뒤쪽에 몰려있으므로,
+        잠금 에피소드가 있는 페이지 이후는 모두 잠금 에피소드라 받을 필요가 없다.
 
         Args:
-            episodes: 정렬된 에피소드 리스트
+            metadata: 웹툰 메타데이터
 
         Returns:
-            (다운로드 가능한 화수, 다운로드 가능한 에피소드 리스트)
+            잠금 에피소드가 처음 나온 페이지까지의 에피소드 정보 (열 단위 배열, no 오름차순)
         """
-        downloadable_episodes = []
+        first_page = self.__first_page
+        if first_page is None:
+            first_page = await self.__get_episode_list_page(1)
+
+        # 이진 탐색으로 잠금 경계 페이지를 찾는다 (탐색 중 받은 페이지는 재사용)
+        fetched: dict[int, NWebtoonArticleListLite] = {1: first_page}
+        lock_page = await self.__find_lock_page(metadata.total_pages, fetched)
+
+        # 경계 페이지까지 아직 받지 않은 페이지들을 병렬로 요청
+        # (경계 이전 페이지를 모두 받으므로, 잠금이 뒤에 몰려있지 않더라도 첫 잠금 화는 놓치지 않는다)
+        last_page = min(lock_page, metadata.total_pages)
+        pages = [page for page in range(1, last_page + 1) if page not in fetched]
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self.__get_episode_list_page(page)) for page in pages
+                ]
+        except ExceptionGroup as group:
+            # 실패한 페이지의 예외를 ExceptionGroup으로 감싸지 않고 그대로 발생
+            raise _first_exception(group) from None
+        fetched.update(zip(pages, (task.result() for task in tasks)))
+
+        # sort=ASC 이므로 페이지 순서대로 이어 붙이면 no 오름차순 (순서 확인은 __initialize에서)
+        return EpisodeColumns.from_articles(
+            article
+            for page in range(1, last_page + 1)
+            for article in fetched[page].articleList
+        )
 
-        for episode in episodes:
-            if episode.thumbnail_lock:
-                # thumbnail_lock이 True인 첫 번째 에피소드를 만나면 중단
-                break
-            downloadable_episodes.append(episode)
+    async def __find_lock_page(
+        self, total_pages: int, fetched: dict[int, NWebtoonArticleListLite]
+    ) -> int:
+        """
+        잠금 에피소드가 처음 나오는 페이지를 이진 탐색으로 찾는 함수
+        N 페이지를 모두 요청하는 대신 O(log N) 번의 요청만 사용한다.
+
+        Args:
+            total_pages: 전체 페이지 수
+            fetched: 이미 받아온 페이지 (탐색 중 받은 페이지도 여기에 추가됨)
 
-        return len(downloadable_episodes), downloadable_episodes
+        Returns:
+            잠금 에피소드가 처음 나오는 페이지 번호 (잠금 에피소드가 없으면 total_pages + 1)
+        """
+        low, high = 1, total_pages + 1
+        while low < high:
+            # 이미 받아온 첫 페이지부터 확인해서, 잠금이 바로 나오면 더 요청하지 않는다
+            mid = low if low in fetched else (low + high) // 2
+            if mid not in fetched:
+                fetched[mid] = await self.__get_episode_list_page(mid)
+
+            if any(
+                article.get("thumbnailLock", False)
+                for article in fetched[mid].articleList
+            ):
+                high = mid
+            else:
+                low = mid + 1
+
+        return low
+
+    def __fill_page(
+        self,
+        episodes: EpisodeColumns,
+        page: int,
+        page_size: int,
+        response: NWebtoonArticleListLite,
+    ) -> int:
+        """
+        list API 응답의 에피소드를 미리 할당한 배열의 (page - 1) * page_size 위치부터 채우는 함수
+
+        Returns:
+            채운 에피소드 수
+        """
+        articles = response.articleList
+        if len(articles) > page_size:
+            raise Exception(
+                f"페이지 {page}의 에피소드 수({len(articles)})가 페이지 크기({page_size})보다 많습니다"
+            )
+
+        episodes.fill((page - 1) * page_size, articles)
+        return len(articles)
+
+    def __find_downloadable_count(self, columns: EpisodeColumns) -> int:
+        """
+        다운로드 가능한 에피소드 수를 찾는 함수
+
+        파이썬 반복문 대신 thumbnail_lock 배열에서 numpy로 첫 번째 잠금 에피소드의 위치를 찾는다.
+        (정렬된 상태에서 첫 번째 잠금 에피소드 앞까지가 다운로드 가능한 에피소드)
+
+        Args:
+            columns: no 오름차순으로 정렬된 에피소드 열 단위 배열
+
+        Returns:
+            다운로드 가능한 화수
+        """
+        # thumbnail_lock이 True인 첫 번째 에피소드의 위치
+        return columns.first_lock_index()
 
     @property
     def total_count(self) -> int:
@@ -304,14 +653,32 @@ class WebtoonAnalyzer:
 
     @property
     def downloadable_episodes(self) -> List[EpisodeInfo]:
-        """다운로드 가능한 에피소드 목록"""
+        """다운로드 가능한 에피소드 목록 (처음 접근할 때 열 단위 배열에서 생성)"""
+        if self.__downloadable_episodes is None:
+            if self.__full_episodes is not None:
+                episodes = self.__full_episodes[: self.__downloadable_count]
+            else:
+                episodes = self.__episode_columns[
+                    : self.__downloadable_count
+                ].to_episodes()
+            self.__downloadable_episodes = episodes
         return self.__downloadable_episodes
 
     @property
     def full_episodes(self) -> List[EpisodeInfo]:
-        """전체 에피소드 목록"""
+        """
+        전체 에피소드 목록 (처음 접근할 때 열 단위 배열에서 생성)
+        full_scan=False로 생성한 경우 잠금 에피소드가 처음 나오는 페이지까지의 에피소드만 담긴다.
+        """
+        if self.__full_episodes is None:
+            self.__full_episodes = self.__episode_columns.to_episodes()
         return self.__full_episodes
 
+    @property
+    def episode_columns(self) -> EpisodeColumns:
+        """전체 에피소드 목록 (열 단위 배열)"""
+        return self.__episode_columns
+
     @property
     def title_id(self) -> int:
         "타이틀 id"
@@ -419,6 +786,9 @@ async def test_analyzer(title_id: int):
 # WebtoonAnalyzer 테스트 메인 함수
 async def test_case():
     """WebtoonAnalyzer 테스트 - 지정된 title ID들로 테스트"""
+    # 생성 즉시 실행 가능한 태스크는 이벤트 루프를 거치지 않고 바로 실행
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     print("WebtoonAnalyzer 테스트 시작")
 
     # 테스트할 title ID들 - 일반 / 베도 / 도전 웹툰, 성인 웹툰 X
@@ -430,6 +800,11 @@ async def test_case():
     print(f"\n{'=' * 50}")
 
 
+# 프로젝트 루트에서 python -m module.webtoon.analyzer 로 실행
 if __name__ == "__main__":
+    # 테스트 실행시에는 분석 과정 디버그 로그도 함께 출력
+    logging.basicConfig(format="[%(levelname)s] %(message)s")
+    logger.setLevel(logging.DEBUG)
+
     # WebtoonAnalyzer 객체 테스트
     asyncio.run(test_case())
@@ -1,13 +1,18 @@
 import asyncio
+import logging
+import os
 import aiohttp
 import aiofiles
-import sys
-import os
 import time
 import random
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
-from bs4 import BeautifulSoup
+from html import unescape
+from typing import Awaitable, Iterable, List, Optional, TypeVar
+from lxml import etree
+import lxml.html
+from yarl import URL
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
@@ -15,25 +20,157 @@ from rich.table import Table
 from rich.live import Live
 
 from type.api.webtoon_type import WebtoonType
-
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
-
-from module.webtoon.analyzer import EpisodeInfo, WebtoonAnalyzer
+from module.webtoon.analyzer import EpisodeInfo, WebtoonAnalyzer, _first_exception
 from module.headers import headers
 from module.settings import Setting, FileSettingType
 from module.file_processor import FileProcessor
+from module.ttl_cache import TTLCache
+
+# 에피소드 단위 진행/오류 로그 (print 대신 logging 사용, 출력 설정은 실행부에서 담당)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
-@dataclass
-class EpisodeImageInfo(EpisodeInfo):
+# EpisodeInfo는 불변 NamedTuple이라 상속하지 않고 같은 필드를 따로 정의한다
+# (이미지 URL 수집 후 img_urls를 채워야 하므로 변경 가능한 dataclass 사용)
+@dataclass(slots=True)
+class EpisodeImageInfo:
     """에피소드 정보 + 각 에피소드의 이미지 URL을 담는 데이터 클래스"""
 
+    no: int
+    subtitle: str
+    thumbnail_lock: bool
     img_urls: List[str] = field(default_factory=list)
 
 
+# 뷰어(div.wt_viewer) 안의 img src만 뽑는 XPath (모듈 로드 시 한 번만 컴파일)
+# - (...)[1] : BeautifulSoup의 select_one 처럼 첫 번째 뷰어만 사용
+# - smart_strings=False : 결과 문자열이 파싱 트리를 참조하지 않도록 일반 str로 반환
+_IMG_XPATH = etree.XPath(
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), ' wt_viewer ')])[1]"
+    "//img/@src[. != '']",
+    smart_strings=False,
+)
+
+# 상세 페이지 전체가 아닌 뷰어 div 부분만 잘라서 파싱하기 위한 정규식
+# (댓글/추천 영역 등 페이지 대부분은 이미지와 무관하므로 DOM을 만들 필요가 없음)
+# 응답 본문을 문자열로 디코딩하지 않고 bytes 그대로 검색한다.
+_VIEWER_OPEN_RE = re.compile(
+    rb"<div\b[^>]*\bclass\s*=\s*[\"']?[^\"'>]*\bwt_viewer(?=[\s\"'>])", re.IGNORECASE
+)
+_DIV_TAG_RE = re.compile(rb"<(/?)div\b", re.IGNORECASE)
+
+# 뷰어 조각 안의 <img> 태그에서 src 값만 뽑는 정규식 (DOM을 만들지 않고 bytes를 한 번만 훑음)
+# - 큰따옴표/작은따옴표/따옴표 없는 값 모두 허용, data-src 같은 다른 속성은 제외
+# - 속성 값 안에 '>'가 들어있는 경우처럼 비정상적인 마크업은 처리하지 못함 (뷰어의 img 태그는 단순하므로 허용)
+_IMG_SRC_RE = re.compile(
+    rb"<img\b[^>]*?\ssrc\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+))", re.IGNORECASE
+)
+
+
+class _ViewerExtractor:
+    """
+    상세 페이지 HTML을 조각(chunk) 단위로 받으면서 뷰어(div.wt_viewer) 부분만 모으는 클래스
+
+    - 뷰어 시작 태그를 찾기 전까지는 받은 내용을 보관 (끝까지 못 찾으면 페이지 전체를 파싱하기 위함)
+    - 뷰어를 찾으면 그 앞부분은 버리고, 중첩된 div 개수를 세며 뷰어가 닫힐 때까지만 보관
+    - 뷰어가 닫힌 뒤에 들어오는 조각은 보관하지 않음
+    """
+
+    __slots__ = ("__buffer", "__found", "__closed", "__depth", "__scan_pos")
+
+    def __init__(self) -> None:
+        self.__buffer = bytearray()
+        self.__found = False  # 뷰어 시작 태그를 찾았는지
+        self.__closed = False  # 뷰어 div가 닫혔는지
+        self.__depth = 0  # 뷰어 안에서 열려있는 div 개수
+        self.__scan_pos = 0  # div 태그를 다음에 찾기 시작할 위치
+
+    @property
+    def found(self) -> bool:
+        """뷰어 시작 태그를 찾았는지 여부 (못 찾았으면 img_urls()가 페이지 전체를 lxml로 파싱)"""
+        return self.__found
+
+    def feed(self, chunk: bytes) -> None:
+        """HTML 조각 추가"""
+        if self.__closed:
+            return
+        self.__buffer += chunk
+
+        if not self.__found:
+            match = _VIEWER_OPEN_RE.search(self.__buffer)
+            if match is None:
+                return
+            # 뷰어 시작 태그 앞부분은 더 이상 필요 없음
+            del self.__buffer[: match.start()]
+            self.__found = True
+
+        # 중첩된 div 개수를 세어 뷰어 div가 닫히는 위치 찾기
+        last_end = self.__scan_pos
+        for tag in _DIV_TAG_RE.finditer(self.__buffer, self.__scan_pos):
+            last_end = tag.end()
+            if tag.group(1):
+                self.__depth -= 1
+                if self.__depth == 0:
+                    self.__closed = True
+                    break
+            else:
+                self.__depth += 1
+
+        if self.__closed:
+            # 닫는 태그 뒤쪽은 필요 없음 (finditer가 끝난 뒤에야 bytearray 크기를 바꿀 수 있음)
+            del self.__buffer[last_end:]
+            return
+
+        # 조각 경계에 걸린 태그("<di" + "v")를 놓치지 않도록 끝부분은 다음에 다시 검색
+        self.__scan_pos = max(last_end, len(self.__buffer) - len(b"</div"))
+
+    def img_urls(self) -> List[str]:
+        """모은 HTML에서 이미지 URL 목록 추출"""
+        if not self.__found:
+            # 뷰어를 찾지 못했으면 페이지 전체를 lxml로 파싱 (이때는 lxml이 <meta charset>을 보고 디코딩)
+            if not self.__buffer:
+                return []
+            return _IMG_XPATH(lxml.html.fromstring(bytes(self.__buffer)))  # type: ignore
+
+        # 뷰어 조각은 정규식으로 src만 추출 (뷰어가 끝까지 닫히지 않았으면 받은 데까지만)
+        # 조각에는 <meta charset>이 없으므로 UTF-8로 디코딩 (네이버 웹툰은 UTF-8)
+        img_urls = []
+        for match in _IMG_SRC_RE.finditer(self.__buffer):
+            src = match.group(match.lastindex or 1)
+            if not src:
+                continue
+            url = src.decode("utf-8", "replace")
+            # &amp; 같은 HTML 엔티티가 있으면 lxml과 같은 결과가 되도록 변환
+            img_urls.append(unescape(url) if "&" in url else url)
+        return img_urls
+
+
+async def _run_with_limit(coros: Iterable[Awaitable[T]], *, limit: int) -> List[T]:
+    """
+    코루틴들을 세마포어로 최대 limit개씩만 동시에 실행하는 함수
+    (URL 수집, 이미지 다운로드에서 같이 사용)
+    각 코루틴이 자체적으로 예외를 처리하므로, 예외가 올라오면 나머지 작업은 취소하고 그대로 전달한다.
+
+    Returns:
+        입력 순서대로 정렬된 결과 리스트
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run_limited(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_limited(coro)) for coro in coros]
+    except ExceptionGroup as group:
+        # 실패한 작업의 예외를 ExceptionGroup으로 감싸지 않고 그대로 발생
+        raise _first_exception(group) from None
+    return [task.result() for task in tasks]
+
+
 class WebtoonDownloader:
     """웹툰 다운로드 관련 기능을 담당하는 클래스"""
 
@@ -58,6 +195,10 @@ class WebtoonDownloader:
             f"https://comic.naver.com/{self.__webtoon_type.value}/detail"
         )
 
+        # title_id까지 들어간 상세 페이지 URL을 yarl.URL로 미리 만들어 두고, 요청마다 no만 추가한다
+        # (aiohttp는 str을 받으면 요청마다 URL을 다시 파싱하지만, URL 객체는 그대로 사용한다)
+        self.__detail_request_url = URL(self.__detail_url).with_query(titleId=title_id)
+
         # 설정 및 파일 처리 객체 초기화
         self.__settings = Setting()
         self.__file_processor = FileProcessor()
@@ -67,137 +208,220 @@ class WebtoonDownloader:
         if nid_aut and nid_ses:
             self.__cookies = {"NID_AUT": nid_aut, "NID_SES": nid_ses}
 
-    async def __get_episode_images(
-        self, episode: EpisodeImageInfo, verbose: bool = False
-    ) -> EpisodeImageInfo:
+        # 상세 페이지/이미지 요청에 재사용할 세션 (async with 진입 시 생성)
+        self.__session: Optional[aiohttp.ClientSession] = None
+
+        # 페이지 전체 파싱(lxml)을 이벤트 루프 밖에서 실행할 스레드 풀 (async with 진입 시 생성)
+        # 기본 executor는 DNS 조회(getaddrinfo)에도 쓰이므로 따로 만들어 사용한다.
+        self.__parse_pool: Optional[ThreadPoolExecutor] = None
+
+        # 에피소드 이미지 URL 캐시 ((웹툰 타입, title_id, no, 인증 여부) -> 이미지 URL들)
+        # 같은 에피소드를 다시 다운로드할 때 (프로그램을 다시 실행한 경우 포함) 상세 페이지를 다시 요청/파싱하지 않는다.
+        # 이미 공개된 에피소드의 이미지 URL은 거의 바뀌지 않으므로 하루 동안 보관 (async with 진입 시 열림)
+        self.__images_cache = TTLCache(
+            "./cache.sqlite3", table="episode_images", ttl=86400
+        )
+
+    async def __aenter__(self) -> "WebtoonDownloader":
+        """
+        상세 페이지와 이미지 요청에 사용할 세션을 생성한다.
+        에피소드마다 세션을 새로 만들면 매번 TCP/TLS 연결을 다시 맺어야 하므로,
+        하나의 세션(커넥션 풀)을 만들어 keep-alive 연결을 재사용한다.
+        """
+        if self.__session is None:
+            # aiohttp[speedups]로 aiodns가 설치되어 있으면 aiohttp가 자동으로 비동기 resolver(c-ares) 사용
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+            )
+            self.__session = aiohttp.ClientSession(
+                headers=headers, cookies=self.__cookies, connector=connector
+            )
+        if self.__parse_pool is None:
+            self.__parse_pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="html-parse"
+            )
+        # 캐시 파일 연결은 다운로드가 끝날 때까지 하나만 열어서 재사용 (파일 I/O는 이벤트 루프 밖에서)
+        await asyncio.to_thread(self.__images_cache.open)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """세션, 파싱용 스레드 풀, 캐시 파일 연결을 닫는 함수"""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+        if self.__parse_pool is not None:
+            # 파싱 작업은 모두 await한 뒤이므로 스레드 종료를 기다리지 않는다
+            self.__parse_pool.shutdown(wait=False)
+            self.__parse_pool = None
+        await asyncio.to_thread(self.__images_cache.close)
+
+    def __images_cache_key(self, episode: EpisodeImageInfo) -> tuple:
+        """이미지 URL 캐시 키 (같은 에피소드라도 웹툰 타입/인증 여부가 다르면 따로 보관)"""
+        return (
+            self.__webtoon_type.value,
+            self.__title_id,
+            episode.no,
+            bool(self.__cookies),
+        )
+
+    @property
+    def __client(self) -> aiohttp.ClientSession:
+        """열려있는 세션을 반환 (async with 블록 밖에서 요청하면 예외 발생)"""
+        if self.__session is None:
+            raise RuntimeError(
+                "세션이 없습니다. async with WebtoonDownloader(...) 블록 안에서 요청해주세요."
+            )
+        return self.__session
+
+    async def __get_episode_images(self, episode: EpisodeImageInfo) -> EpisodeImageInfo:
         """
         특정 에피소드의 이미지 URL들을 가져오는 함수
+        (로그 레벨이 DEBUG일 때만 HTML 수신/파싱 시간을 측정해서 남긴다)
 
         Args:
             episode: 에피소드 정보
-            verbose: 상세 시간 정보 출력 여부 (기본값: False)
 
         Returns:
             이미지 URL이 추가된 에피소드 정보
         """
-        url = f"{self.__detail_url}?titleId={self.__title_id}&no={episode.no}"
+        url = self.__detail_request_url % {"no": episode.no}
 
         # 요청 안정성을 높이기 위해 최대 3회까지 재시도(지수 백오프) 적용
         max_retries = 3
         backoff_base = 1.0  # 초 단위, 1 -> 2 -> 4 ...
 
-        try:
-            async with aiohttp.ClientSession(
-                headers=headers, cookies=self.__cookies
-            ) as session:
-                last_error: Optional[Exception] = None
-                for attempt in range(max_retries + 1):
-                    try:
-                        # 각 요청에 타임아웃을 부여해 무한 대기 방지
-                        async with session.get(
-                            url, timeout=aiohttp.ClientTimeout(total=10)
-                        ) as response:
-                            if response.status == 200:
-                                # HTML 내용 가져오기 시간 측정
-                                html_start_time = time.time()
-                                html_content = await response.text()
-                                html_end_time = time.time()
-                                html_time = html_end_time - html_start_time
-
-                                # BeautifulSoup 파싱 시간 측정
-                                parse_start_time = time.time()
-                                soup = BeautifulSoup(html_content, "lxml")
-
-                                # div.wt_viewer 태그 안의 모든 img 태그 찾기
-                                viewer = soup.select_one("div.wt_viewer")
-
-                                if viewer:
-                                    img_tags = viewer.find_all("img")  # type: ignore
-                                    img_urls = []
-
-                                    for img in img_tags:
-                                        src = img.get("src")  # type: ignore
-                                        if src:
-                                            img_urls.append(src)
-                                else:
-                                    img_urls = []
-
-                                parse_end_time = time.time()
-                                parse_time = parse_end_time - parse_start_time
-                                total_parse_time = parse_end_time - html_start_time
+        # 시간 측정은 디버그 로그를 볼 때만 수행
+        timing = logger.isEnabledFor(logging.DEBUG)
 
-                                episode.img_urls = img_urls
-                                if verbose:
-                                    print(
-                                        f"  {episode.no}화: {len(img_urls)}개 이미지 URL 수집 완료 (HTML: {html_time:.3f}s, 파싱: {parse_time:.3f}s, 총: {total_parse_time:.3f}s)"
-                                    )
-                                else:
-                                    print(
-                                        f"  {episode.no}화: {len(img_urls)}개 이미지 URL 수집 완료"
-                                    )
-                                # 성공 시 재시도 루프 종료
-                                break
+        try:
+            session = self.__client
+            last_error: Optional[Exception] = None
+            for attempt in range(max_retries + 1):
+                try:
+                    # 각 요청에 타임아웃을 부여해 무한 대기 방지
+                    async with session.get(
+                        url, timeout=aiohttp.ClientTimeout(total=10)
+                    ) as response:
+                        if response.status == 200:
+                            if timing:
+                                html_start_time = time.perf_counter()
+
+                            # 본문 전체를 하나의 bytes로 모으지 않고, 조각 단위로 받으면서 뷰어 부분만 보관한다.
+                            # (text()처럼 문자열로 디코딩하지도 않음)
+                            # 뷰어가 닫힌 뒤에도 나머지 본문은 끝까지 읽어야 커넥션을 keep-alive로 재사용할 수 있다.
+                            extractor = _ViewerExtractor()
+                            async for chunk in response.content.iter_chunked(32768):
+                                extractor.feed(chunk)
+
+                            if timing:
+                                parse_start_time = time.perf_counter()
+
+                            # div.wt_viewer 태그 안의 모든 img src 찾기 (뷰어가 없으면 빈 리스트)
+                            if extractor.found:
+                                # 뷰어 조각의 정규식 추출은 짧아서 이벤트 루프에서 바로 처리 (스레드 전환 비용이 더 큼)
+                                img_urls = extractor.img_urls()
                             else:
-                                # 비정상 응답 상태코드일 때 재시도 (429 등)
-                                if attempt < max_retries:
-                                    # 429인 경우 Retry-After 헤더를 우선 적용
-                                    if response.status == 429:
-                                        retry_after = response.headers.get(
-                                            "Retry-After"
-                                        )
-                                        if retry_after and retry_after.isdigit():
-                                            delay = float(retry_after)
-                                        else:
-                                            delay = backoff_base * (2**attempt)
+                                # 페이지 전체를 lxml로 파싱해야 하면 스레드 풀에서 실행
+                                # (lxml은 파싱 중 GIL을 풀기 때문에 다른 에피소드의 응답 수신과 겹쳐서 처리됨)
+                                img_urls = (
+                                    await asyncio.get_running_loop().run_in_executor(
+                                        self.__parse_pool, extractor.img_urls
+                                    )
+                                )
+                            episode.img_urls = img_urls
+
+                            if timing:
+                                parse_end_time = time.perf_counter()
+                                logger.debug(
+                                    "  %d화: %d개 이미지 URL 수집 완료 (HTML: %.3fs, 파싱: %.3fs, 총: %.3fs)",
+                                    episode.no,
+                                    len(img_urls),
+                                    parse_start_time - html_start_time,
+                                    parse_end_time - parse_start_time,
+                                    parse_end_time - html_start_time,
+                                )
+                            # 성공 시 재시도 루프 종료
+                            break
+                        else:
+                            # 비정상 응답 상태코드일 때 재시도 (429 등)
+                            if attempt < max_retries:
+                                # 429인 경우 Retry-After 헤더를 우선 적용
+                                if response.status == 429:
+                                    retry_after = response.headers.get("Retry-After")
+                                    if retry_after and retry_after.isdigit():
+                                        delay = float(retry_after)
                                     else:
                                         delay = backoff_base * (2**attempt)
-
-                                    print(
-                                        f"  {episode.no}화: HTTP {response.status} (재시도 {attempt+1}/{max_retries}, {delay:.1f}s 대기)"
-                                    )
-                                    await asyncio.sleep(delay)
-                                    continue
                                 else:
-                                    print(
-                                        f"  {episode.no}화: HTTP 요청 실패 ({response.status}), 재시도 한도 초과"
-                                    )
-                                    episode.img_urls = []
-                    except Exception as e:
-                        # 네트워크 오류 등 예외 발생 시 재시도
-                        last_error = e
-                        if attempt < max_retries:
-                            delay = backoff_base * (2**attempt)
-                            print(
-                                f"  {episode.no}화: 요청 중 오류 발생 - {e} (재시도 {attempt+1}/{max_retries}, {delay:.1f}s 대기)"
-                            )
-                            await asyncio.sleep(delay)
-                            continue
-                        else:
-                            print(
-                                f"  {episode.no}화: 이미지 URL 수집 중 오류 발생 - {e} (재시도 한도 초과)"
-                            )
-                            episode.img_urls = []
-                else:
-                    # for-else: break 없이 종료된 경우 (모든 시도 실패)
-                    if last_error is not None:
-                        print(f"  {episode.no}화: 최종 실패 - {last_error}")
-                    episode.img_urls = []
+                                    delay = backoff_base * (2**attempt)
+
+                                logger.warning(
+                                    "  %d화: HTTP %d (재시도 %d/%d, %.1fs 대기)",
+                                    episode.no,
+                                    response.status,
+                                    attempt + 1,
+                                    max_retries,
+                                    delay,
+                                )
+                                await asyncio.sleep(delay)
+                                continue
+                            else:
+                                logger.warning(
+                                    "  %d화: HTTP 요청 실패 (%d), 재시도 한도 초과",
+                                    episode.no,
+                                    response.status,
+                                )
+                                episode.img_urls = []
+                except Exception as e:
+                    # 네트워크 오류 등 예외 발생 시 재시도
+                    last_error = e
+                    if attempt < max_retries:
+                        delay = backoff_base * (2**attempt)
+                        logger.warning(
+                            "  %d화: 요청 중 오류 발생 - %s (재시도 %d/%d, %.1fs 대기)",
+                            episode.no,
+                            e,
+                            attempt + 1,
+                            max_retries,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    else:
+                        logger.warning(
+                            "  %d화: 이미지 URL 수집 중 오류 발생 - %s (재시도 한도 초과)",
+                            episode.no,
+                            e,
+                        )
+                        episode.img_urls = []
+            else:
+                # for-else: break 없이 종료된 경우 (모든 시도 실패)
+                if last_error is not None:
+                    logger.warning("  %d화: 최종 실패 - %s", episode.no, last_error)
+                episode.img_urls = []
         except Exception as e:
-            # 세션 생성 등 상위 레벨 예외 처리
-            print(f"  {episode.no}화: 이미지 URL 수집 중 오류 발생 - {e}")
+            # 세션 미생성 등 상위 레벨 예외 처리
+            logger.warning("  %d화: 이미지 URL 수집 중 오류 발생 - %s", episode.no, e)
             episode.img_urls = []
 
         return episode
 
-    async def get_episodes_with_images_batch(
-        self, episodes: List[EpisodeImageInfo], batch_size: int
+    async def get_episodes_with_images(
+        self, episodes: List[EpisodeImageInfo], max_concurrent: Optional[int] = None
     ) -> List[EpisodeImageInfo]:
         """
-        에피소드들의 이미지 URL을 배치 단위로 가져오는 함수
+        에피소드들의 이미지 URL을 동시 요청 수를 제한하며 가져오는 함수
+        배치 단위로 끊어서 기다리지 않고, 세마포어로 항상 최대 max_concurrent개의 요청이 진행되도록 한다.
 
         Args:
             episodes: 이미지 URL을 수집할 에피소드 리스트
-            batch_size: 한 번에 처리할 에피소드 수
+            max_concurrent: 최대 동시 요청 수 (기본값: 설정 파일의 batchsize)
 
         Returns:
             이미지 URL이 포함된 에피소드 리스트
@@ -206,50 +430,62 @@ class WebtoonDownloader:
             print("수집할 에피소드가 없습니다.")
             return []
 
+        # async with 블록 밖에서 호출된 경우에는 이 호출 동안만 세션을 열고 닫는다
+        # (세션 없이 진행하면 에피소드마다 요청이 실패해서 빈 결과만 리턴되므로)
+        if self.__session is None:
+            async with self:
+                return await self.get_episodes_with_images(episodes, max_concurrent)
+
+        # 설정에서 최대 동시 요청 수 가져오기
+        if max_concurrent is None:
+            max_concurrent = self.__settings.batch_size
+
         print(f"\n{len(episodes)}개 에피소드의 이미지 URL을 수집합니다...")
-        print(f"배치 크기: {batch_size}개씩 처리")
+        print(f"최대 동시 요청: {max_concurrent}개")
         print(
             "URL 수집 중 길게 멈추거나 작동하지 않을 시 프로그램 종료 후 조금 기다린 후 다시 실행해주세요."
         )
         print(
-            "URL 수집에 문제가 많이 발생할 경우 settings.ini 파일에서 batchsize의 값을 줄이고 delayseconds를 늘려보세요."
+            "URL 수집에 문제가 많이 발생할 경우 settings.ini 파일에서 batchsize의 값을 줄여보세요."
         )
 
-        episodes_with_images = []
-        total_episodes = len(episodes)
-
-        # 배치 단위로 처리
-        for i in range(0, total_episodes, batch_size):
-            batch = episodes[i : i + batch_size]
-            print(
-                f"\n배치 {i//batch_size + 1}/{(total_episodes + batch_size - 1)//batch_size} 처리 중... ({i+1}~{min(i+batch_size, total_episodes)}화)"
+        # 최근에 수집한 에피소드는 상세 페이지를 요청하지 않고 캐시된 URL 사용
+        # (캐시 조회/저장은 에피소드마다 하지 않고 수집 전후에 한 번씩만, 이벤트 루프 밖에서 처리)
+        cache_keys = [self.__images_cache_key(episode) for episode in episodes]
+        cached = await asyncio.to_thread(self.__images_cache.get_many, cache_keys)
+        to_fetch = []
+        for episode, key in zip(episodes, cache_keys):
+            cached_urls = cached.get(key)
+            if cached_urls:
+                episode.img_urls = list(cached_urls)
+            else:
+                to_fetch.append(episode)
+        if cached:
+            logger.debug(
+                "캐시된 이미지 URL 사용: %d개 에피소드", len(episodes) - len(to_fetch)
             )
 
-            # 현재 배치의 이미지 URL을 병렬로 가져오기
-            tasks = []
-            for episode in batch:
-                task = self.__get_episode_images(episode)
-                tasks.append(task)
-
-            # 현재 배치의 요청을 동시에 실행
-            batch_results: List[EpisodeImageInfo] = await asyncio.gather(
-                *tasks, return_exceptions=True
-            )
+        # 모든 에피소드의 요청을 한꺼번에 등록하고, 동시 요청 수는 세마포어로 제한
+        # (서버 부하 방지 및 429 응답 예방)
+        # (__get_episode_images는 실패해도 예외 대신 img_urls를 비운 에피소드를 리턴)
+        fetched = await _run_with_limit(
+            (self.__get_episode_images(episode) for episode in to_fetch),
+            limit=max_concurrent,
+        )
 
-            # 결과 처리
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    print(f"  {batch[j].no}화: 오류 발생 - {result}")
-                    batch[j].img_urls = []
-                    episodes_with_images.append(batch[j])
-                else:
-                    episodes_with_images.append(result)
+        # 이미지를 찾은 경우만 한 번에 캐시 (빈 결과는 다음에 다시 시도)
+        await asyncio.to_thread(
+            self.__images_cache.set_many,
+            [
+                (self.__images_cache_key(episode), episode.img_urls)
+                for episode in fetched
+                if episode.img_urls
+            ],
+        )
 
-            # 서버 부하 방지를 위한 잠시 대기
-            if i + batch_size < total_episodes:
-                delay = self.__settings.delay_seconds
-                print(f"서버 부하 방지를 위해 {delay}초 대기합니다.")
-                await asyncio.sleep(delay)
+        # 캐시에서 가져온 에피소드와 새로 수집한 에피소드 모두 입력 순서대로 리턴
+        # (__get_episode_images는 받은 에피소드 객체에 img_urls를 채워서 그대로 리턴)
+        episodes_with_images = list(episodes)
 
         print(f"\n총 {len(episodes_with_images)}개 에피소드의 이미지 URL 수집 완료!")
 
@@ -275,10 +511,7 @@ class WebtoonDownloader:
 
         for attempt in range(max_retries + 1):
             try:
-                # 첫 시도 시 다운로드할 이미지 URL 출력 (진행 상황 표시)
-                if attempt == 0:
-                    print(img_url, flush=True)
-                async with session.get(img_url, headers=headers) as response:
+                async with session.get(img_url) as response:
                     if response.status == 200:
                         # 디렉토리가 없으면 생성
                         file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -293,14 +526,21 @@ class WebtoonDownloader:
                             delay = backoff_base * (2**attempt)
                             # 0~20% 지터 추가로 동시 재시도 충돌 방지
                             delay *= 1 + random.uniform(0, 0.2)
-                            print(
-                                f"실패: {img_url} (HTTP {response.status}) -> 재시도 {attempt+1}/{max_retries} ({delay:.1f}s 대기)"
+                            logger.warning(
+                                "실패: %s (HTTP %d) -> 재시도 %d/%d (%.1fs 대기)",
+                                img_url,
+                                response.status,
+                                attempt + 1,
+                                max_retries,
+                                delay,
                             )
                             await asyncio.sleep(delay)
                             continue
                         else:
-                            print(
-                                f"실패: {img_url} (HTTP {response.status}), 재시도 한도 초과"
+                            logger.warning(
+                                "실패: %s (HTTP %d), 재시도 한도 초과",
+                                img_url,
+                                response.status,
                             )
                             return False
             except Exception as e:
@@ -308,13 +548,18 @@ class WebtoonDownloader:
                 if attempt < max_retries:
                     delay = backoff_base * (2**attempt)
                     delay *= 1 + random.uniform(0, 0.2)
-                    print(
-                        f"오류: {img_url} - {e} -> 재시도 {attempt+1}/{max_retries} ({delay:.1f}s 대기)"
+                    logger.warning(
+                        "오류: %s - %s -> 재시도 %d/%d (%.1fs 대기)",
+                        img_url,
+                        e,
+                        attempt + 1,
+                        max_retries,
+                        delay,
                     )
                     await asyncio.sleep(delay)
                     continue
                 else:
-                    print(f"오류: {img_url} - {e} (재시도 한도 초과)")
+                    logger.warning("오류: %s - %s (재시도 한도 초과)", img_url, e)
                     return False
 
         # 모든 경로가 반환되도록 안전망 리턴 (정상 동작 중엔 도달하지 않음)
@@ -348,101 +593,96 @@ class WebtoonDownloader:
         )
         print(f"최대 동시 다운로드: {max_concurrent}개")
 
-        # 세마포어로 전체 이미지 다운로드 동시성 제한
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def download_single_episode_image(session, episode, img_url, img_idx):
             """단일 에피소드의 단일 이미지 다운로드"""
-            async with semaphore:
-                # settings에서 folder zero fill 값 가져오기
-                folder_zfill: int = self.__settings.get_zero_fill(
-                    FileSettingType.Folder
-                )
+            # settings에서 folder zero fill 값 가져오기
+            folder_zfill: int = self.__settings.get_zero_fill(FileSettingType.Folder)
 
-                # 가져온 zero fill 값 에피소드 번호에 적용
-                episode_no_zfill: str = str(episode.no).zfill(folder_zfill)
+            # 가져온 zero fill 값 에피소드 번호에 적용
+            episode_no_zfill: str = str(episode.no).zfill(folder_zfill)
 
-                # 윈도우 파일시스템 금지문자 / 마침표 처리: 제목과 에피소드 제목 처리
-                safe_title: str = self.__file_processor.remove_forbidden_str(
-                    self.__webtoon_title
-                )
-                safe_subtitle: str = self.__file_processor.remove_forbidden_str(
-                    episode.subtitle
-                )
+            # 윈도우 파일시스템 금지문자 / 마침표 처리: 제목과 에피소드 제목 처리
+            safe_title: str = self.__file_processor.remove_forbidden_str(
+                self.__webtoon_title
+            )
+            safe_subtitle: str = self.__file_processor.remove_forbidden_str(
+                episode.subtitle
+            )
 
-                # 다운로드 폴더 경로 만들기
-                download_dir: Path = (
-                    Path("Webtoon_Download")
-                    / safe_title
-                    / f"[{episode_no_zfill}] {safe_subtitle}"
-                )
+            # 다운로드 폴더 경로 만들기
+            download_dir: Path = (
+                Path("Webtoon_Download")
+                / safe_title
+                / f"[{episode_no_zfill}] {safe_subtitle}"
+            )
 
-                # 파일 확장자 추출 (기본값: .jpg)
-                ext = ".jpg"
-                if "." in img_url.split("/")[-1]:
-                    ext = "." + img_url.split(".")[-1].split("?")[0]
+            # 파일 확장자 추출 (기본값: .jpg)
+            ext = ".jpg"
+            if "." in img_url.split("/")[-1]:
+                ext = "." + img_url.split(".")[-1].split("?")[0]
 
-                # 동일하게 settings에서 image zero fill 값 가져와서 이미지 파일명에 적용
-                image_zfill: int = self.__settings.get_zero_fill(FileSettingType.Image)
-                img_filename: str = str(img_idx + 1).zfill(image_zfill)
-                file_path: Path = download_dir / f"{img_filename}{ext}"
-                # 다운로드 시작 전 URL을 출력하여 진행 상황 표시
-                print(f"[{episode.no}화] {img_idx+1}: {img_url}", flush=True)
-                return await self.__download_single_image(session, img_url, file_path)
+            # 동일하게 settings에서 image zero fill 값 가져와서 이미지 파일명에 적용
+            image_zfill: int = self.__settings.get_zero_fill(FileSettingType.Image)
+            img_filename: str = str(img_idx + 1).zfill(image_zfill)
+            file_path: Path = download_dir / f"{img_filename}{ext}"
+            # 다운로드 시작 전 URL을 출력하여 진행 상황 표시
+            # (이미지마다 호출되므로 f-string 대신 %-포맷 인자로 넘겨서, 출력하지 않는 레벨이면 포맷팅도 생략)
+            logger.info("[%d화] %d: %s", episode.no, img_idx + 1, img_url)
+            return await self.__download_single_image(session, img_url, file_path)
 
         try:
-            async with aiohttp.ClientSession(cookies=self.__cookies) as session:
-                # 모든 에피소드의 모든 이미지를 하나의 태스크 리스트로 생성
-                all_tasks = []
-                episode_task_counts = []  # 각 에피소드별 태스크 수 기록
-
-                for episode in episodes:
-                    if not hasattr(episode, "img_urls") or not episode.img_urls:
-                        print(f"  {episode.no}화: 다운로드할 이미지 URL이 없습니다.")
-                        episode_task_counts.append(0)
-                        continue
+            session = self.__client
+            # 모든 에피소드의 모든 이미지를 하나의 태스크 리스트로 생성
+            all_tasks = []
+            episode_task_counts = []  # 각 에피소드별 태스크 수 기록
+
+            for episode in episodes:
+                if not episode.img_urls:
+                    logger.warning(
+                        "  %d화: 다운로드할 이미지 URL이 없습니다.", episode.no
+                    )
+                    episode_task_counts.append(0)
+                    continue
 
-                    episode_task_counts.append(len(episode.img_urls))
+                episode_task_counts.append(len(episode.img_urls))
 
-                    # 해당 에피소드의 모든 이미지 태스크 생성
-                    for img_idx, img_url in enumerate(episode.img_urls):
-                        task = download_single_episode_image(
-                            session, episode, img_url, img_idx
-                        )
-                        all_tasks.append(task)
-
-                # 모든 이미지를 동시에 다운로드 (세마포어로 동시성 제한)
-                print(f"\n전체 {len(all_tasks)}개 이미지 다운로드 시작...")
-                print("=" * 60)
-                all_results = await asyncio.gather(*all_tasks, return_exceptions=True)
-                print("=" * 60)
-
-                # 에피소드별 결과 집계
-                episode_results = []
-                result_idx = 0
-
-                for i, episode in enumerate(episodes):
-                    task_count = episode_task_counts[i]
-                    if task_count == 0:
-                        episode_results.append(False)
-                        continue
+                # 해당 에피소드의 모든 이미지 태스크 생성
+                for img_idx, img_url in enumerate(episode.img_urls):
+                    task = download_single_episode_image(
+                        session, episode, img_url, img_idx
+                    )
+                    all_tasks.append(task)
+
+            # 모든 이미지를 동시에 다운로드 (세마포어로 동시성 제한)
+            print(f"\n전체 {len(all_tasks)}개 이미지 다운로드 시작...")
+            print("=" * 60)
+            all_results = await _run_with_limit(all_tasks, limit=max_concurrent)
+            print("=" * 60)
+
+            # 에피소드별 결과 집계
+            episode_results = []
+            result_idx = 0
+
+            for i, episode in enumerate(episodes):
+                task_count = episode_task_counts[i]
+                if task_count == 0:
+                    episode_results.append(False)
+                    continue
 
-                    # 해당 에피소드의 결과들 추출
-                    episode_task_results = all_results[
-                        result_idx : result_idx + task_count
-                    ]
-                    result_idx += task_count
+                # 해당 에피소드의 결과들 추출
+                episode_task_results = all_results[result_idx : result_idx + task_count]
+                result_idx += task_count
 
-                    # 성공 개수 계산
-                    success_count = sum(
-                        1 for result in episode_task_results if result is True
-                    )
-                    episode_success = success_count == task_count
-                    episode_results.append(episode_success)
+                # 성공 개수 계산 (각 결과는 성공 여부 bool)
+                success_count = sum(episode_task_results)
+                episode_success = success_count == task_count
+                episode_results.append(episode_success)
 
-                    print(f"  {episode.no}화: {success_count}/{task_count}개 성공")
+                logger.info(
+                    "  %d화: %d/%d개 성공", episode.no, success_count, task_count
+                )
 
-                return episode_results
+            return episode_results
 
         except Exception as e:
             print(f"이미지 다운로드 중 오류 발생: {e}")
@@ -457,7 +697,7 @@ class WebtoonDownloader:
         Args:
             start: 시작 화수 (1부터 시작)
             end: 끝 화수 (1부터 시작)
-            batch_size: 한 번에 처리할 배치 크기
+            batch_size: 이미지 URL 수집 시 최대 동시 요청 수 (기본값: 설정 파일의 batchsize)
 
         Returns:
             다운로드 성공 여부
@@ -465,7 +705,7 @@ class WebtoonDownloader:
         if not self.__episodes:
             raise ValueError("다운로드할 에피소드가 없습니다.")
 
-        # 설정에서 배치 크기 가져오기
+        # 설정에서 이미지 URL 수집 동시 요청 수 가져오기
         if batch_size is None:
             batch_size = self.__settings.batch_size
 
@@ -480,9 +720,7 @@ class WebtoonDownloader:
             )
 
         # 다운로드 할 에피소드 부분 추출
-        selected_episodes: List[EpisodeImageInfo] = self.__episodes[
-            start_idx : end_idx + 1
-        ]
+        selected_episodes: List[EpisodeInfo] = self.__episodes[start_idx : end_idx + 1]
 
         # Rich를 사용해서 예쁜 다운로드 시작 메시지 출력
         console = Console()
@@ -494,7 +732,7 @@ class WebtoonDownloader:
 
         table.add_row("웹툰 제목:", f"{self.__webtoon_title} ({self.__title_id})")
         table.add_row("에피소드 수:", f"{len(selected_episodes)}개")
-        table.add_row("배치 크기:", str(batch_size))
+        table.add_row("URL 수집 동시 요청 수:", str(batch_size))
         table.add_row(
             "다운로드 할 에피소드:",
             f"{selected_episodes[0].no}화 ~ {selected_episodes[-1].no}화",
@@ -524,21 +762,23 @@ class WebtoonDownloader:
                 )
                 episode_image_infos.append(episode_image_info)
 
-            # 배치 단위로 이미지 URL 수집
-            print("이미지 URL 수집 시작")
-            episodes_with_images = await self.get_episodes_with_images_batch(
-                episode_image_infos, batch_size
-            )
+            # URL 수집과 이미지 다운로드 동안 하나의 세션(커넥션 풀)을 공유하고, 끝나면 세션을 닫는다.
+            async with self:
+                # 동시 요청 수를 제한하며 이미지 URL 수집
+                print("이미지 URL 수집 시작")
+                episodes_with_images = await self.get_episodes_with_images(
+                    episode_image_infos, batch_size
+                )
 
-            console.print(
-                f"\n[green]✓[/green] 총 {len(episodes_with_images)}개 에피소드의 이미지 URL 수집 완료!"
-            )
+                console.print(
+                    f"\n[green]✓[/green] 총 {len(episodes_with_images)}개 에피소드의 이미지 URL 수집 완료!"
+                )
 
-            # 모든 에피소드의 이미지를 한꺼번에 다운로드 (동시성 제한 적용)
-            console.print("\n[yellow]📥 다운로드 시작[/yellow]")
-            download_results = await self.__download_all_images_concurrent(
-                episodes_with_images
-            )
+                # 모든 에피소드의 이미지를 한꺼번에 다운로드 (동시성 제한 적용)
+                console.print("\n[yellow]📥 다운로드 시작[/yellow]")
+                download_results = await self.__download_all_images_concurrent(
+                    episodes_with_images
+                )
 
             # 결과 요약
             success_count = sum(download_results)
@@ -684,6 +924,9 @@ async def test_downloader(title_id: int, start: int, end: int):
 
 async def test_case():
     """WebtoonDownloader 테스트 - 지정된 title ID들로 테스트"""
+    # 생성 즉시 실행 가능한 태스크는 이벤트 루프를 거치지 않고 바로 실행
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # 테스트할 title id들과 화수 범위
     test_cases = [
         # (835801, 1, 2),  # 달마건
@@ -695,6 +938,8 @@ async def test_case():
         await test_downloader(title_id, start, end)
 
 
-# 메인 실행부
+# 메인 실행부 (프로젝트 루트에서 python -m module.webtoon.downloader 로 실행)
 if __name__ == "__main__":
+    # 이미지 다운로드 진행 상황(INFO)과 재시도/실패 로그(WARNING) 출력
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(test_case())
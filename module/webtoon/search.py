@@ -1,4 +1,3 @@
-import json
 import os
 import re
 from typing import List
@@ -98,11 +97,9 @@ class WebtoonSearch:
             search_api_url = f"https://comic.naver.com/api/search/all?keyword={keyword}"
             res = requests.get(search_api_url, headers=headers)
 
-            # json.loads()를 사용하여 JSON 응답을 파이썬 객체로 변환
-            res_json = json.loads(res.content)
-
-            # json 응답을 미리 정의한 dataclass 타입으로 변환(type-safety)
-            webtoon: NWebtoonSearchData = NWebtoonSearchData.from_dict(res_json)
+            # 응답 본문(bytes)을 텍스트 디코딩 / dict 변환 없이
+            # 미리 정의한 pydantic 타입으로 바로 변환(type-safety)
+            webtoon: NWebtoonSearchData = NWebtoonSearchData.from_json(res.content)
 
             # 일반 웹툰, 베스트 도전, 도전만화 갯수 파싱
             webtoon_cnt: int = webtoon.searchWebtoonResult.totalCount
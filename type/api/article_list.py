@@ -1,5 +1,5 @@
 import json
-from typing import List, Any, Dict
+from typing import List, Any, Dict, TypedDict
 from pydantic import BaseModel, Field, ConfigDict
 
 from type.api.comic_info import WebtoonCode
@@ -79,6 +79,39 @@ class NWebtoonArticleListData(BaseModel):
             self.extra_fields = self.__pydantic_extra__ or {}
 
 
+# 에피소드 목록 수집(WebtoonAnalyzer)에서 실제로 읽는 필드만 정의한 경량 모델
+# 전체 모델은 extra 필드 보관, 할당 검증 등으로 검증 비용이 커서
+# 페이지마다 반복되는 목록 수집에서는 아래 모델을 사용한다.
+# 에피소드 항목은 페이지당 수십 개씩 만들어지므로 모델 인스턴스 대신 TypedDict(dict)로 검증
+# (pydantic-core가 JSON에서 바로 dict를 만들고, 정의하지 않은 키는 버림)
+# ArticleItem처럼 빠진 필드가 있어도 검증에 실패하지 않도록 total=False로 정의하고,
+# 읽는 쪽에서 .get(키, 기본값)으로 ArticleItem과 같은 기본값(0, "", False)을 사용한다.
+class ArticleItemLite(TypedDict, total=False):
+    no: int
+    subtitle: str
+    thumbnailLock: bool
+
+
+class PageInfoLite(BaseModel):
+    pageSize: int = 0
+    totalPages: int = 0
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class NWebtoonArticleListLite(BaseModel):
+    totalCount: int = 0
+    articleList: List[ArticleItemLite] = Field(default_factory=list)
+    pageInfo: PageInfoLite = Field(default_factory=PageInfoLite)
+
+    model_config = ConfigDict(extra="ignore")
+
+    # 응답 본문(bytes)을 dict로 만들지 않고 pydantic-core에서 바로 파싱 & 검증
+    @classmethod
+    def from_json(cls, data: bytes):
+        return cls.model_validate_json(data)
+
+
 # 직접 실행했을때만 실행되는 코드 (import 되었을때는 실행되지 않음, 모듈 단위 테스트용)
 if __name__ == "__main__":
     # json 모듈을 이용하여 JSON 문자열을 파이썬 딕셔너리로 변환
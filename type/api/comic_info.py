@@ -131,6 +131,11 @@ class NWebtoonMainData(BaseModel):
     def from_dict(cls, data: dict):
         return cls.model_validate(data)
 
+    # 응답 본문(bytes)을 dict로 만들지 않고 pydantic-core에서 바로 파싱 & 검증
+    @classmethod
+    def from_json(cls, data: bytes):
+        return cls.model_validate_json(data)
+
     def model_post_init(self, __context: Any) -> None:
         """모델 초기화 후 실행되는 메서드 - 동적 필드 처리"""
         # 정의되지 않은 필드들을 extra_fields에 저장
@@ -138,6 +143,29 @@ class NWebtoonMainData(BaseModel):
             self.extra_fields = self.__pydantic_extra__ or {}
 
 
+# 웹툰 분석(WebtoonAnalyzer)에서 실제로 읽는 필드만 정의한 경량 모델
+# 전체 모델은 작가/큐레이션 태그/광고 정보 등 사용하지 않는 필드까지 모두 검증하므로
+# 메타데이터 수집에서는 아래 모델을 사용한다.
+class AgeLite(BaseModel):
+    type: str = ""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class NWebtoonMainDataLite(BaseModel):
+    titleName: str = ""
+    webtoonLevelCode: WebtoonCode = WebtoonCode.WEBTOON
+    age: AgeLite = Field(default_factory=AgeLite)
+    synopsis: str = ""
+
+    model_config = ConfigDict(extra="ignore")
+
+    # 응답 본문(bytes)을 dict로 만들지 않고 pydantic-core에서 바로 파싱 & 검증
+    @classmethod
+    def from_json(cls, data: bytes):
+        return cls.model_validate_json(data)
+
+
 # 직접 실행했을때만 실행되는 코드 (import 되었을때는 실행되지 않음, 모듈 단위 테스트용)
 if __name__ == "__main__":
     # json 모듈을 이용하여 JSON 문자열을 파이썬 딕셔너리로 변환
@@ -124,6 +124,11 @@ class NWebtoonSearchData(BaseModel):
     def from_dict(cls, data: dict):
         return cls.model_validate(data)
 
+    # 응답 본문(bytes)을 dict로 만들지 않고 pydantic-core에서 바로 파싱 & 검증
+    @classmethod
+    def from_json(cls, data: bytes):
+        return cls.model_validate_json(data)
+
     def model_post_init(self, __context: Any) -> None:
         """모델 초기화 후 실행되는 메서드 - 동적 필드 처리"""
         if hasattr(self, "__pydantic_extra__"):